@@ -2,28 +2,38 @@
 (because it depends on dev dependencies).
 """
 
-from dataclasses import dataclass
+from __future__ import annotations
+from dataclasses import dataclass, field
 from functools import cached_property
 from importlib.metadata import PackagePath, files
+from typing import TYPE_CHECKING
 
-from doctor_genova.external_resolver import ExternalResolution
+# NOTE  Only needed for typing, and importing it pulls in the docs-build stack.
+if TYPE_CHECKING:
+    from doctor_genova.external_resolver import ExternalResolution
 
+#: Sentinel for cache misses in `RichResolver._resolutions`.
+_NOT_FOUND = object()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RichResolution:
     BASE_URL = "https://rich.readthedocs.io/en/latest/reference/"
 
     name: str
     page_module_name: str
+    page_url: str = field(init=False, repr=False, compare=False)
 
-    @cached_property
-    def page_url(self) -> str:
+    def __post_init__(self) -> None:
+        # Computed once up front rather than through `cached_property`; the
+        # dataclass is frozen, so the assignment has to go around `__setattr__`.
         if self.page_module_name == "rich":
-            return self.BASE_URL + "init.html"
+            page_url = self.BASE_URL + "init.html"
         else:
-            return (
+            page_url = (
                 self.BASE_URL + self.page_module_name.split(".")[-1] + ".html"
             )
+        object.__setattr__(self, "page_url", page_url)
 
     def get_name(self) -> str:
         return self.name
@@ -34,47 +44,66 @@ class RichResolution:
         return self.page_url + "#" + self.name
 
     def get_md_link(self) -> str:
-        return "[{}]({})".format(self.name, self.get_url())
+        return f"[{self.name}]({self.get_url()})"
 
 
 class RichResolver:
     @staticmethod
     def as_module_name(file: PackagePath) -> None | str:
-        if file.suffix != ".py":
-            return None
+        # Work off `parts` once, with plain `str` ops, rather than going through
+        # `suffix` / `stem` / `with_suffix`, which each build new path objects.
+        parts = file.parts
 
-        if file.parts[0] != "rich":
+        if parts[0] != "rich" or not parts[-1].endswith(".py"):
             return None
 
-        if file.stem == "__init__":
-            return ".".join(file.parts[:-1])
+        if parts[-1] == "__init__.py":
+            return ".".join(parts[:-1])
 
-        return ".".join(file.with_suffix("").parts)
+        return ".".join((*parts[:-1], parts[-1][:-3]))
+
+    _resolutions: dict[str, None | RichResolution]
 
     def __init__(self):
+        self._resolutions = {}
+
+    @cached_property
+    def _module_names(self) -> frozenset[str]:
+        # Scanned on first `resolve_name` rather than at construction, since
+        # the resolver is created while loading the build config whether or
+        # not any names end up resolved against it.
         metadata_files = files("rich")
 
         if metadata_files is None:
             raise Exception("rich not found")
 
-        self._module_names = set()
-
-        for file in metadata_files:
-            if module_name := self.as_module_name(file):
-                self._module_names.add(module_name)
+        return frozenset(
+            module_name
+            for file in metadata_files
+            if (module_name := self.as_module_name(file))
+        )
 
     def resolve_name(self, name: str) -> None | ExternalResolution:
-        parts = name.split(".")
-
-        if any(part.startswith("_") for part in parts):
+        # Only names in the `rich` package can resolve, so turn everything else
+        # away before doing any work on it.
+        if not (name == "rich" or name.startswith("rich.")):
             return None
 
-        length = len(parts)
+        # Skip private names (the first part is `rich`, so can't be private)
+        if "._" in name:
+            return None
 
-        if length == 1:
-            page_module_name = parts[0]
-        else:
-            page_module_name = ".".join(parts[:2])
+        # The same names get resolved over and over across a docs build, and
+        # resolutions are immutable, so hang on to them (misses included).
+        resolution = self._resolutions.get(name, _NOT_FOUND)
+        if resolution is _NOT_FOUND:
+            resolution = self._resolutions[name] = self._resolve_rich_name(name)
+        return resolution
+
+    def _resolve_rich_name(self, name: str) -> None | RichResolution:
+        # Pages are per top-level module, so `rich.x.y` is on the `rich.x` page
+        dot_index = name.find(".", 5)
+        page_module_name = name if dot_index == -1 else name[:dot_index]
 
         if page_module_name in self._module_names:
             return RichResolution(
@@ -3,23 +3,46 @@ from collections.abc import Callable, Mapping, Collection
 from enum import Enum
 from inspect import isclass
 import traceback
-from types import TracebackType
+from types import FunctionType, MethodType, TracebackType
 from typing import Any, Type
+from weakref import WeakKeyDictionary
 
-from splatlog.lib import fmt_type, has_method
+from splatlog.lib import fmt_type, has_method, required_arity
 
 from .json_typings import JSONEncodable
 
 THandleFn = Callable[[Any], JSONEncodable]
 
+#: Sentinel for cache misses and missing class attributes.
+_NOT_FOUND = object()
 
-@dataclasses.dataclass(frozen=True, order=True)
+#: Cache for `encode_class`. Weak so that encoding instances of dynamically
+#: created classes doesn't keep those classes alive.
+_class_names: WeakKeyDictionary[type, str] = WeakKeyDictionary()
+
+
+def encode_class(cls: type) -> str:
+    # Same as `fmt_type`, but the same handful of classes get encoded over and
+    # over, so remember the results.
+    name = _class_names.get(cls)
+    if name is None:
+        name = _class_names[cls] = fmt_type(cls)
+    return name
+
+
+@dataclasses.dataclass(frozen=True, order=True, slots=True)
 class DefaultHandler:
     priority: int
     name: str
     is_match: Callable[[Any], bool]
     handle: THandleFn
 
+    #: `True` when `is_match` gives the same answer for every instance of a
+    #: type, which lets `splatlog.json.json_encoder.JSONEncoder` remember the
+    #: handler it picked per type instead of re-scanning. Handlers where this is
+    #: `False` are still checked on every object.
+    match_by_type: bool = dataclasses.field(default=False, compare=False)
+
 
 def instance_handler(
     cls: Type, priority: int, handle: THandleFn
@@ -29,21 +52,202 @@ def instance_handler(
         priority=priority,
         is_match=lambda obj: isinstance(obj, cls),
         handle=handle,
+        match_by_type=True,
     )
 
 
+def get_method_plan(cls: type, method_name: str) -> None | bool:
+    """
+    What `has_method(obj, method_name, req_arity=0)` comes to for instances of
+    `cls` that don't have `method_name` in their own `__dict__`, or `None` when
+    that can't be told from the class alone.
+
+    ##### Examples #####
+
+    ```python
+    >>> class A:
+    ...     def f(self):
+    ...         pass
+    ...
+    ...     def g(self, x):
+    ...         pass
+    ...
+    ...     @classmethod
+    ...     def h(cls):
+    ...         pass
+
+    >>> get_method_plan(A, "f"), get_method_plan(A, "g")
+    (True, False)
+
+    >>> get_method_plan(A, "nope")
+    False
+
+    >>> get_method_plan(A, "h") is None
+    True
+
+    >>> class B:
+    ...     def __getattr__(self, name):
+    ...         raise AttributeError(name)
+
+    >>> get_method_plan(B, "nope") is None
+    True
+
+    ```
+    """
+    if cls.__getattribute__ is not object.__getattribute__:
+        return None
+
+    # NOTE  Walk the MRO rather than use `inspect.getattr_static` on `cls`,
+    #       which would also find attributes of the metaclass -- those are not
+    #       visible from instances.
+    attr = _NOT_FOUND
+    has_getattr = False
+    for base in cls.__mro__:
+        base_dict = base.__dict__
+        if attr is _NOT_FOUND:
+            attr = base_dict.get(method_name, _NOT_FOUND)
+        if "__getattr__" in base_dict:
+            has_getattr = True
+
+    if attr is _NOT_FOUND:
+        # Regular lookup comes up empty, so only `__getattr__` could answer
+        return None if has_getattr else False
+
+    if not isinstance(attr, FunctionType):
+        # `classmethod`, `property` and other descriptors can return anything
+        return None
+
+    try:
+        # Instances see the function bound, so measure it bound
+        return required_arity(MethodType(attr, _NOT_FOUND)) == 0
+    except (TypeError, ValueError):
+        return None
+
+
 def method_handler(method_name: str, priority: int) -> DefaultHandler:
+    plans: WeakKeyDictionary[type, None | bool] = WeakKeyDictionary()
+
+    def is_match(obj: Any) -> bool:
+        # `has_method` needs a `getattr` and `inspect.signature` per object;
+        # instead look at the class once, and only fall back to `has_method`
+        # when the instance could say otherwise.
+        cls = type(obj)
+        plan = plans.get(cls, _NOT_FOUND)
+        if plan is _NOT_FOUND:
+            plan = plans[cls] = get_method_plan(cls, method_name)
+
+        if plan is None:
+            return has_method(obj, method_name, req_arity=0)
+
+        obj_dict = getattr(obj, "__dict__", None)
+        if obj_dict is not None and method_name in obj_dict:
+            return has_method(obj, method_name, req_arity=0)
+
+        return plan
+
     return DefaultHandler(
         name=f".{method_name}()",
         priority=priority,
-        is_match=lambda obj: has_method(obj, method_name, req_arity=0),
+        is_match=is_match,
         handle=lambda obj: getattr(obj, method_name)(),
+        # NOTE  Not decided by type: an instance attribute (or a `__getattr__`)
+        #       can provide a bound method on one instance and not another.
+        match_by_type=False,
     )
 
 
+#: Types of leaf values `convert_dataclasses` can pass through as-is. Checked
+#: inline before recursing, since most field values are one of these.
+_ATOMIC_TYPES = frozenset((str, int, float, bool, type(None)))
+
+#: The attribute `dataclasses.is_dataclass` looks for, checked directly in
+#: `convert_dataclasses` since that gets called on every value it reaches.
+_DATACLASS_FIELDS = "__dataclass_fields__"
+
+#: Field names per dataclass, for `get_dataclass_field_names`.
+_dataclass_field_names: WeakKeyDictionary[
+    type, tuple[str, ...]
+] = WeakKeyDictionary()
+
+
+def get_dataclass_field_names(cls: type) -> tuple[str, ...]:
+    names = _dataclass_field_names.get(cls)
+    if names is None:
+        names = _dataclass_field_names[cls] = tuple(
+            field.name for field in dataclasses.fields(cls)
+        )
+    return names
+
+
+def convert_dataclasses(value: Any, path: set[int]) -> Any:
+    """
+    Convert dataclass instances in `value` to `dict` of their fields, going
+    through the same things `dataclasses.asdict` does -- dataclass fields and
+    `list`, `tuple` and `dict` entries -- but without deep-copying everything
+    else.
+
+    Raises `ValueError` if `value` refers back to itself (or to anything whose
+    `id` is in `path`), where `asdict` would have run out of stack.
+    """
+    if type(value) in _ATOMIC_TYPES:
+        return value
+
+    if isinstance(value, (list, tuple)):
+        kind = list
+    elif isinstance(value, dict):
+        kind = dict
+    elif hasattr(type(value), _DATACLASS_FIELDS):
+        kind = None
+    else:
+        return value
+
+    value_id = id(value)
+    if value_id in path:
+        raise ValueError(
+            f"{encode_class(value.__class__)} instance refers back to itself"
+        )
+    path.add(value_id)
+
+    if kind is list:
+        converted = [
+            item
+            if type(item) in _ATOMIC_TYPES
+            else convert_dataclasses(item, path)
+            for item in value
+        ]
+    elif kind is dict:
+        converted = {
+            key: item
+            if type(item) in _ATOMIC_TYPES
+            else convert_dataclasses(item, path)
+            for key, item in value.items()
+        }
+    else:
+        converted = {}
+        for name in get_dataclass_field_names(value.__class__):
+            item = getattr(value, name)
+            converted[name] = (
+                item
+                if type(item) in _ATOMIC_TYPES
+                else convert_dataclasses(item, path)
+            )
+
+    path.discard(value_id)
+    return converted
+
+
+def handle_dataclass(obj: Any) -> dict[str, Any]:
+    # NOTE  Nested dataclasses are converted here, in one pass, rather than
+    #       being left for the encoder to send back through this handler, so
+    #       each object is only visited once. A cycle raises, which sends `obj`
+    #       on to the fallback handler, like the `RecursionError` out of
+    #       `dataclasses.asdict` used to.
+    return convert_dataclasses(obj, set())
+
+
 def handle_exception(error: BaseException) -> dict[str, JSONEncodable]:
     dct = dict(
-        type=fmt_type(error.__class__),
+        type=encode_class(error.__class__),
         msg=str(error),
     )
 
@@ -65,20 +269,22 @@ CLASS_HANDLER = DefaultHandler(
     name="class",
     priority=20,
     is_match=isclass,
-    handle=fmt_type,
+    handle=encode_class,
+    match_by_type=True,
 )
 
 DATACLASS_HANDLER = DefaultHandler(
     name="dataclasses.dataclass",
     priority=30,
     is_match=dataclasses.is_dataclass,
-    handle=dataclasses.asdict,
+    handle=handle_dataclass,
+    match_by_type=True,
 )
 
 ENUM_HANDLER = instance_handler(
     cls=Enum,
     priority=40,
-    handle=lambda obj: f"{fmt_type(obj.__class__)}.{obj.name}",
+    handle=lambda obj: f"{encode_class(obj.__class__)}.{obj.name}",
 )
 
 TRACEBACK_HANDLER = instance_handler(
@@ -105,7 +311,7 @@ MAPPING_HANDLER = instance_handler(
     cls=Mapping,
     priority=50,
     handle=lambda obj: {
-        "__class__": fmt_type(obj.__class__),
+        "__class__": encode_class(obj.__class__),
         "items": dict(obj),
     },
 )
@@ -114,7 +320,7 @@ COLLECTION_HANDLER = instance_handler(
     cls=Collection,
     priority=60,
     handle=lambda obj: {
-        "__class__": fmt_type(obj.__class__),
+        "__class__": encode_class(obj.__class__),
         "items": tuple(obj),
     },
 )
@@ -124,9 +330,10 @@ FALLBACK_HANDLER = DefaultHandler(
     priority=100,
     is_match=lambda obj: True,
     handle=lambda obj: {
-        "__class__": fmt_type(obj.__class__),
+        "__class__": encode_class(obj.__class__),
         "__repr__": repr(obj),
     },
+    match_by_type=True,
 )
 
 ALL_HANDLERS = tuple(
@@ -1,17 +1,41 @@
 import json
 from typing import Literal, Optional, TypeVar, IO, Union
+from collections import deque
 from collections.abc import Iterable, Callable, Mapping
+from types import MappingProxyType
+from weakref import WeakKeyDictionary
 
 from splatlog.lib import each, fmt_type
 from splatlog.lib.text import fmt
 from splatlog.typings import JSONEncoderCastable
 
-from .default_handlers import ALL_HANDLERS, DefaultHandler
+from .default_handlers import (
+    ALL_HANDLERS,
+    COLLECTION_HANDLER,
+    MAPPING_HANDLER,
+    DefaultHandler,
+)
 
 __all__ = ["JSONEncoder"]
 
 Self = TypeVar("Self", bound="JSONEncoder")
 
+#: Index into `ALL_HANDLERS` of the first type-determined handler that matches
+#: each type, shared by all encoders that use the default handlers.
+#:
+#: Seeded with the common concrete collections that make it to
+#: `JSONEncoder.default`, so even the first one skips the scan and its
+#: `collections.abc` instance checks.
+_DEFAULT_HANDLER_INDEXES: WeakKeyDictionary[type, int] = WeakKeyDictionary(
+    {
+        MappingProxyType: ALL_HANDLERS.index(MAPPING_HANDLER),
+        **dict.fromkeys(
+            (set, frozenset, bytes, bytearray, deque),
+            ALL_HANDLERS.index(COLLECTION_HANDLER),
+        ),
+    }
+)
+
 
 class JSONEncoder(json.JSONEncoder):
     """
@@ -167,7 +191,7 @@ class JSONEncoder(json.JSONEncoder):
 
     ###### Dataclasses ######
 
-    Dataclass instances are encoded via `dataclasses.asdict`.
+    Dataclass instances are encoded as a JSON object of their fields.
 
     ```python
 
@@ -184,6 +208,59 @@ class JSONEncoder(json.JSONEncoder):
 
     ```
 
+    Dataclass instances that refer back to themselves can't be encoded that
+    way, and are left to the catch-all (see _Everything Else_, below) rather
+    than failing the whole encode.
+
+    ```python
+
+    >>> @dataclasses.dataclass
+    ... class Node:
+    ...     name: str
+    ...     links: list
+    ...     other: object = None
+
+    >>> node = Node(name="a", links=[])
+    >>> node.links.append(node)
+    >>> pretty_encoder.dump(node, stdout)
+    {
+        "__class__": "splatlog.json.json_encoder.Node",
+        "__repr__": "Node(name='a', links=[...], other=None)"
+    }
+
+    ```
+
+    That goes for cycles through other dataclasses as well.
+
+    ```python
+
+    >>> a = Node(name="a", links=[])
+    >>> b = Node(name="b", links=[], other=a)
+    >>> a.links.append(b)
+    >>> pretty_encoder.dump(a, stdout)
+    {
+        "__class__": "splatlog.json.json_encoder.Node",
+        "__repr__": "Node(name='a', links=[Node(name='b', ...)], other=None)"
+    }
+
+    ```
+
+    Which is only the case when the reference forms a cycle; the same instance
+    showing up more than once is fine.
+
+    ```python
+
+    >>> @dataclasses.dataclass
+    ... class Pair:
+    ...     left: object
+    ...     right: object
+
+    >>> dc = DC(x=1, y=2, z=3)
+    >>> encoder.dump(Pair(left=dc, right=[dc]), stdout)
+    {"left": {"x": 1, "y": 2, "z": 3}, "right": [{"x": 1, "y": 2, "z": 3}]}
+
+    ```
+
     ###### Enums ######
 
     Instances of `enum.Enum` are encoded _nominally_ as JSON strings, composed
@@ -452,6 +529,7 @@ class JSONEncoder(json.JSONEncoder):
         )
 
     _handlers: Optional[list[DefaultHandler]] = None
+    _handler_indexes: Optional[WeakKeyDictionary[type, int]] = None
     _continue_on_handler_error: bool = True
 
     def __init__(
@@ -473,20 +551,132 @@ class JSONEncoder(json.JSONEncoder):
             self.add_handlers(handlers)
 
     def default(self, obj):
-        for handler in (
-            ALL_HANDLERS if self._handlers is None else self._handlers
-        ):
+        """
+        ##### Examples #####
+
+        Most handlers are decided by the type of the object alone, so the
+        encoder remembers which of those matched for each type and skips
+        straight to it next time. Handlers that depend on the object itself are
+        still checked every time, so an instance that provides its own
+        `to_json_encodable` is honored even after plain instances of the same
+        class were encoded.
+
+        ```python
+        >>> from types import MethodType
+
+        >>> class Box:
+        ...     pass
+
+        >>> plain_box = Box()
+        >>> special_box = Box()
+        >>> special_box.to_json_encodable = MethodType(
+        ...     lambda self: "special", special_box
+        ... )
+
+        >>> encoder = JSONEncoder.compact()
+        >>> encoder.encode(plain_box)
+        '{"__class__":"splatlog.json.json_encoder.Box","__repr__":"<...>"}'
+        >>> encoder.encode(special_box)
+        '"special"'
+
+        ```
+
+        That also holds the other way around, when handler errors are not
+        swallowed.
+
+        ```python
+        >>> strict_encoder = JSONEncoder.compact()
+        >>> strict_encoder._continue_on_handler_error = False
+        >>> strict_encoder.encode(special_box)
+        '"special"'
+        >>> strict_encoder.encode(plain_box)
+        '{"__class__":"splatlog.json.json_encoder.Box","__repr__":"<...>"}'
+
+        ```
+
+        Class objects are remembered by their type (the metaclass) like any
+        other object, which still leaves a `classmethod` free to apply to one
+        class and not another.
+
+        ```python
+        >>> class Plain:
+        ...     pass
+
+        >>> class Custom:
+        ...     @classmethod
+        ...     def to_json_encodable(cls):
+        ...         return "custom"
+
+        >>> encoder.encode([Plain, Custom])
+        '["splatlog.json.json_encoder.Plain","custom"]'
+        >>> encoder.encode([Custom, Plain])
+        '["custom","splatlog.json.json_encoder.Plain"]'
+
+        ```
+
+        Adding or removing handlers forgets what was remembered.
+
+        ```python
+        >>> encoder.encode({1, 2})
+        '{"__class__":"set","items":[1,2]}'
+
+        >>> encoder.add_handlers(
+        ...     DefaultHandler(
+        ...         priority=1,
+        ...         name="set",
+        ...         is_match=lambda obj: isinstance(obj, set),
+        ...         handle=sorted,
+        ...         match_by_type=True,
+        ...     )
+        ... )
+        >>> encoder.encode({2, 1})
+        '[1,2]'
+
+        >>> encoder.remove_handlers(lambda handler: handler.name == "set")
+        (DefaultHandler(priority=1, name='set', ...),)
+        >>> encoder.encode({1, 2})
+        '{"__class__":"set","items":[1,2]}'
+
+        ```
+        """
+        if self._handlers is None:
+            handlers = ALL_HANDLERS
+            handler_indexes = _DEFAULT_HANDLER_INDEXES
+        else:
+            handlers = self._handlers
+            handler_indexes = self._handler_indexes
+
+        # `start` is the first type-determined handler known to match. Those
+        # ahead of it are known not to, and can be skipped; the others still
+        # have to be asked.
+        obj_type = type(obj)
+        start = handler_indexes.get(obj_type)
+        if start is None:
+            remember, start = True, -1
+        else:
+            remember = False
+
+        for index, handler in enumerate(handlers):
+            if index < start and handler.match_by_type:
+                continue
+
             try:
-                if handler.is_match(obj):
+                if index == start or handler.is_match(obj):
+                    if remember and handler.match_by_type:
+                        handler_indexes[obj_type] = index
+                        remember = False
                     return handler.handle(obj)
             except Exception as error:
-                if self._continue_on_handler_error:
-                    pass
-                else:
+                if not self._continue_on_handler_error:
                     raise TypeError(
                         f"Encoding handler {handler.name} raised"
                     ) from error
 
+                # Can't tell if a type-determined `is_match` would have
+                # matched, so don't remember anything past it
+                if handler.match_by_type:
+                    remember = False
+
         return super().default(obj)
 
     def dump(self, obj, fp: IO) -> None:
@@ -505,6 +695,7 @@ class JSONEncoder(json.JSONEncoder):
         self._handlers.extend(each(handlers))
 
         self._handlers.sort()
+        self._handler_indexes = WeakKeyDictionary()
 
     def remove_handlers(
         self, match: Callable[[DefaultHandler], bool]
@@ -517,4 +708,6 @@ class JSONEncoder(json.JSONEncoder):
         for h in matches:
             self._handlers.remove(h)
 
+        self._handler_indexes = WeakKeyDictionary()
+
         return matches
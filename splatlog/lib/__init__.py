@@ -123,10 +123,11 @@ def required_arity(fn: Callable) -> int:
 
     ```
     """
-    return sum(
-        int(is_required_parameter(parameter))
-        for parameter in signature(fn).parameters.values()
-    )
+    arity = 0
+    for parameter in signature(fn).parameters.values():
+        if is_required_parameter(parameter):
+            arity += 1
+    return arity
 
 
 def has_method(
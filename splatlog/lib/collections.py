@@ -69,16 +69,22 @@ def each(*targets, descend=default_each_descend, deep=True):
 
     ```
     """
-    for target in targets:
-        if target is not None:
+    # Walk with an explicit stack of iterators rather than recursing, so deep
+    # nesting doesn't stack up a generator frame per level.
+    stack = [iter(targets)]
+    while stack:
+        for target in stack[-1]:
+            if target is None:
+                continue
             if descend(target):
-                for entry in target:
-                    if deep:
-                        yield from each(entry, descend=descend, deep=deep)
-                    else:
-                        yield entry
+                if deep:
+                    stack.append(iter(target))
+                    break
+                yield from target
             else:
                 yield target
+        else:
+            stack.pop()
 
 
 def partition_mapping(
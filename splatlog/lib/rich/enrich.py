@@ -54,7 +54,11 @@ def enrich(value, inline=False):
         return value
 
     if isinstance(value, str):
-        if all(c.isprintable() or c.isspace() for c in value):
+        # `str.isprintable` settles the common case in C; only strings with
+        # whitespace like newlines or tabs need the per-character check.
+        if value.isprintable() or all(
+            c.isprintable() or c.isspace() for c in value
+        ):
             return value
         else:
             return repr_highlight(value)
@@ -4,7 +4,6 @@ from typing import Any, Callable, Mapping, Sequence, TypeVar, cast
 from rich.text import Text
 from rich.segment import Segment
 
-from splatlog.lib.typeguard import check_type
 from splatlog.lib.text import fmt, fmt_type_of
 from .enrich import enrich, repr_highlight
 
@@ -1,12 +1,78 @@
 from typing import Any, TypeGuard, TypeVar
-from typeguard import check_type, TypeCheckError
+from weakref import WeakKeyDictionary
 
 T = TypeVar("T")
 
 
 def satisfies(value: Any, expected_type: type[T]) -> TypeGuard[T]:
+    # NOTE  `typeguard` is by far the heaviest import in the package, and most
+    #       processes never end up needing it, so it's pulled in on first use
+    #       instead of at package import.
+    from typeguard import check_type, TypeCheckError
+
     try:
         check_type(value, expected_type)
     except TypeCheckError:
         return False
     return True
+
+
+#: Results of `satisfies_by_type`, by `type(value)` and then `expected_type`.
+_RESULTS_BY_TYPE: WeakKeyDictionary[type, dict[Any, bool]] = WeakKeyDictionary()
+
+
+def satisfies_by_type(value: Any, expected_type: type[T]) -> TypeGuard[T]:
+    """Like `satisfies`, but caches the result per `type(value)`.
+
+    Only correct for expected types whose check depends on nothing but the
+    type of the value -- classes, protocols, `typing.IO[str]` -- and **not**
+    for things like `typing.Literal` that look at the value itself.
+
+    ##### Examples #####
+
+    `typing.IO[str]` comes down to an `io.TextIOBase` instance check, so any
+    one value answers for its type.
+
+    ```python
+    >>> import io
+    >>> from typing import IO
+
+    >>> satisfies_by_type(io.StringIO(), IO[str])
+    True
+    >>> satisfies_by_type(io.BytesIO(), IO[str])
+    False
+    >>> satisfies_by_type(io.StringIO("different value"), IO[str])
+    True
+
+    ```
+
+    `splatlog.typings.RichConsoleCastable` is decided by type for anything
+    that's not a `str` -- only strings can be one of the `StdioName` literals,
+    which is why `str` values must go through `satisfies` instead.
+
+    ```python
+    >>> from rich.console import Console
+    >>> from splatlog.typings import RichConsoleCastable
+
+    >>> satisfies_by_type(Console(), RichConsoleCastable)
+    True
+    >>> satisfies_by_type(io.StringIO(), RichConsoleCastable)
+    True
+    >>> satisfies_by_type(123, RichConsoleCastable)
+    False
+
+    >>> satisfies("stdout", RichConsoleCastable)
+    True
+    >>> satisfies("blah", RichConsoleCastable)
+    False
+
+    ```
+    """
+    results = _RESULTS_BY_TYPE.get(type(value))
+    if results is None:
+        results = _RESULTS_BY_TYPE[type(value)] = {}
+
+    result = results.get(expected_type)
+    if result is None:
+        result = results[expected_type] = satisfies(value, expected_type)
+    return result
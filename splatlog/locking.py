@@ -4,9 +4,11 @@ from typing import ContextManager
 
 _NULL_CONTEXT = nullcontext()
 
+#: The `logging` module's internal lock, resolved once at import. `logging`
+#: creates it at import and never replaces it, so there's no need to look it
+#: up again every time `lock` is called.
+_LOGGING_LOCK: ContextManager = getattr(logging, "_lock", None) or _NULL_CONTEXT
+
 
 def lock() -> ContextManager:
-    logging_lock = getattr(logging, "_lock", None)
-    if logging_lock:
-        return logging_lock
-    return _NULL_CONTEXT
+    return _LOGGING_LOCK
@@ -1,15 +1,19 @@
 """Manage _named handlers_..."""
 
 import logging
-from pathlib import Path
+from pathlib import Path, PosixPath, WindowsPath
 from typing import Any, Callable, Optional, Union, cast
 from collections.abc import Mapping
 
 from splatlog.json.json_formatter import JSONFormatter
-from splatlog.lib.collections import partition_mapping
 from splatlog.lib.text import fmt
-from splatlog.lib.typeguard import satisfies
-from splatlog.levels import get_level_value, is_level
+from splatlog.lib.typeguard import satisfies, satisfies_by_type
+from splatlog.levels import (
+    get_level_value,
+    is_level,
+    is_level_name,
+    is_level_value,
+)
 from splatlog.locking import lock
 from splatlog.rich_handler import RichHandler
 from splatlog.typings import (
@@ -20,6 +24,13 @@ from splatlog.typings import (
 from splatlog.verbosity.verbosity_levels_filter import VerbosityLevelsFilter
 
 
+#: The root logger, which named handlers are attached to. Resolved once here
+#: rather than going through `logging.getLogger` on every handler swap.
+_ROOT_LOGGER = logging.getLogger()
+
+#: Sentinel for keys missing from an export handler mapping.
+_NOT_FOUND = object()
+
 _registry: dict[str, NamedHandlerCast] = {}
 _handlers: dict[str, None | logging.Handler] = {}
 
@@ -72,21 +83,141 @@ def set_named_handler(name: str, value: object) -> None:
     cast = _registry[name]
     new_handler = cast(value)
 
+    # Re-setting the installed handler is a no-op, so don't bother taking the
+    # lock for it. Reading `_handlers` is safe without it; anything that does
+    # need to change is re-checked under the lock below.
+    if new_handler is _handlers.get(name):
+        return
+
     with lock():
         old_handler = _handlers.get(name)
 
         if new_handler is not old_handler:
-            root_logger = logging.getLogger()
-
             if old_handler is not None:
-                root_logger.removeHandler(old_handler)
+                _ROOT_LOGGER.removeHandler(old_handler)
 
             if new_handler is not None:
-                root_logger.addHandler(new_handler)
+                _ROOT_LOGGER.addHandler(new_handler)
 
             _handlers[name] = new_handler
 
 
+def _cast_to_none(value: object) -> None:
+    return None
+
+
+def _cast_identity(value: logging.Handler) -> logging.Handler:
+    return value
+
+
+def _console_handler_from_bool(value: bool) -> Optional[logging.Handler]:
+    return RichHandler() if value else None
+
+
+def _console_handler_from_mapping(value: Mapping) -> logging.Handler:
+    return RichHandler(**value)
+
+
+def _console_handler_from_str(value: str) -> logging.Handler:
+    # Same precedence as the full chain in `cast_console_handler`: stdio names
+    # win over level names. Checking them directly avoids a `satisfies` call.
+    if value == "stdout" or value == "stderr":
+        return RichHandler(console=value)
+
+    if is_level_name(value):
+        return RichHandler(level=value)
+
+    raise _console_handler_cast_error(value)
+
+
+def _console_handler_from_int(value: int) -> logging.Handler:
+    if is_level_value(value):
+        return RichHandler(level=value)
+
+    raise _console_handler_cast_error(value)
+
+
+def _console_handler_cast_error(value: object) -> TypeError:
+    return TypeError(
+        "Expected {}, given {}: {}".format(
+            fmt(ConsoleHandlerCastable),
+            fmt(type(value)),
+            fmt(value),
+        )
+    )
+
+
+def _export_handler_from_mapping(value: Mapping) -> logging.Handler:
+    if "stream" in value:
+        cls = logging.StreamHandler
+    elif "filename" in value:
+        cls = logging.FileHandler
+    else:
+        raise KeyError(
+            (
+                "Mappings passed to {} must contain 'filename' or "
+                "'stream' keys, given {}"
+            ).format(
+                fmt(cast_export_handler),
+                fmt(value),
+            )
+        )
+
+    # Pull out the keys that are applied after construction; whatever is left
+    # goes to the handler class.
+    init_kwds = dict(value)
+    level = init_kwds.pop("level", _NOT_FOUND)
+    formatter = init_kwds.pop("formatter", None)
+    verbosity_levels = init_kwds.pop("verbosity_levels", None)
+
+    handler = cls(**init_kwds)
+
+    if level is not _NOT_FOUND:
+        handler.setLevel(get_level_value(level))
+
+    # If a `logging.Formatter` was provided just assign that
+    if isinstance(formatter, logging.Formatter):
+        handler.formatter = formatter
+    else:
+        # Cast to a `JSONFormatter`
+        handler.formatter = JSONFormatter.cast(formatter)
+
+    if verbosity_levels:
+        VerbosityLevelsFilter.set_on(handler, verbosity_levels)
+
+    return handler
+
+
+def _export_handler_from_path(value: Union[str, Path]) -> logging.Handler:
+    handler = logging.FileHandler(filename=value)
+    handler.formatter = JSONFormatter()
+    return handler
+
+
+#: Casts for the most common `cast_console_handler` inputs, keyed by _exact_
+#: type so they resolve with a single `dict` lookup. Anything else (subclasses,
+#: `typing.IO`, consoles) goes through the full check chain.
+_CONSOLE_HANDLER_CASTS: dict[type, NamedHandlerCast] = {
+    bool: _console_handler_from_bool,
+    type(None): _cast_to_none,
+    dict: _console_handler_from_mapping,
+    str: _console_handler_from_str,
+    int: _console_handler_from_int,
+    RichHandler: _cast_identity,
+}
+
+#: Same deal as `_CONSOLE_HANDLER_CASTS`, for `cast_export_handler`.
+_EXPORT_HANDLER_CASTS: dict[type, NamedHandlerCast] = {
+    type(None): _cast_to_none,
+    dict: _export_handler_from_mapping,
+    str: _export_handler_from_path,
+    PosixPath: _export_handler_from_path,
+    WindowsPath: _export_handler_from_path,
+    logging.StreamHandler: _cast_identity,
+    logging.FileHandler: _cast_identity,
+}
+
+
 @named_handler("console")
 def cast_console_handler(
     value: ConsoleHandlerCastable,
@@ -226,19 +357,22 @@ def cast_console_handler(
         ```
     """
 
-    if value is True:
-        return RichHandler()
-
-    if value is None or value is False:
-        return None
+    if fast_cast := _CONSOLE_HANDLER_CASTS.get(type(value)):
+        return fast_cast(value)
 
     if isinstance(value, logging.Handler):
         return value
 
     if isinstance(value, Mapping):
-        return RichHandler(**value)
-
-    if satisfies(value, RichConsoleCastable):
+        return _console_handler_from_mapping(value)
+
+    # NOTE  Only `str` values can match the `StdioName` literals; for anything
+    #       else membership in `RichConsoleCastable` is decided by type alone.
+    if (
+        satisfies(value, RichConsoleCastable)
+        if isinstance(value, str)
+        else satisfies_by_type(value, RichConsoleCastable)
+    ):
         # NOTE  This `typing.cast` seems to be required because the
         #       `typing.TypeGuard` in `satisfies` does not evaluate correctly
         #       with a complex type such as `RichConsoleCastable`.
@@ -247,66 +381,25 @@ def cast_console_handler(
     if is_level(value):
         return RichHandler(level=value)
 
-    raise TypeError(
-        "Expected {}, given {}: {}".format(
-            fmt(ConsoleHandlerCastable),
-            fmt(type(value)),
-            fmt(value),
-        )
-    )
+    raise _console_handler_cast_error(value)
 
 
 @named_handler("export")
 def cast_export_handler(value) -> Optional[logging.Handler]:
-    if value is None or value is False:
+    if fast_cast := _EXPORT_HANDLER_CASTS.get(type(value)):
+        return fast_cast(value)
+
+    if value is False:
         return None
 
     if isinstance(value, logging.Handler):
         return value
 
     if isinstance(value, Mapping):
-        if "stream" in value:
-            cls = logging.StreamHandler
-        elif "filename" in value:
-            cls = logging.FileHandler
-        else:
-            raise KeyError(
-                (
-                    "Mappings passed to {} must contain 'filename' or "
-                    "'stream' keys, given {}"
-                ).format(
-                    fmt(cast_export_handler),
-                    fmt(value),
-                )
-            )
-
-        post_kwds, init_kwds = partition_mapping(
-            value, {"level", "formatter", "verbosity_levels"}
-        )
-
-        handler = cls(**init_kwds)
-
-        if "level" in post_kwds:
-            handler.setLevel(get_level_value(post_kwds["level"]))
-
-        formatter = post_kwds.get("formatter")
-
-        # If a `logging.Formatter` was provided just assign that
-        if isinstance(formatter, logging.Formatter):
-            handler.formatter = formatter
-        else:
-            # Cast to a `JSONFormatter`
-            handler.formatter = JSONFormatter.cast(formatter)
-
-        if verbosity_levels := post_kwds.get("verbosity_levels"):
-            VerbosityLevelsFilter.set_on(handler, verbosity_levels)
-
-        return handler
+        return _export_handler_from_mapping(value)
 
     if isinstance(value, (str, Path)):
-        handler = logging.FileHandler(filename=value)
-        handler.formatter = JSONFormatter()
-        return handler
+        return _export_handler_from_path(value)
 
     raise TypeError(
         "Expected {}, given {}: {!r}".format(
@@ -16,7 +16,7 @@ def root_name(module_name: str) -> str:
 
     ```
     """
-    return module_name.split(".")[0]
+    return module_name.partition(".")[0]
 
 
 def is_in_hierarchy(hierarchy_name: str, logger_name: str):
@@ -2,6 +2,7 @@
 """
 
 from __future__ import annotations
+from functools import cache
 import re
 from typing import IO, ClassVar, Literal, Mapping, Optional, Union
 import logging
@@ -11,7 +12,6 @@ from rich.table import Table
 from rich.console import Console
 from rich.text import Text
 from rich.theme import Theme
-from rich.traceback import Traceback
 from rich.style import Style
 
 from splatlog.lib import fmt
@@ -23,7 +23,7 @@ from splatlog.lib.rich import (
     enrich,
     RichFormatter,
 )
-from splatlog.lib.typeguard import satisfies
+from splatlog.lib.typeguard import satisfies, satisfies_by_type
 from splatlog.splat_handler import SplatHandler
 from splatlog.typings import (
     Level,
@@ -34,6 +34,19 @@ from splatlog.typings import (
 )
 
 
+# Row labels are the same for every record, so build them once. Rendering does
+# not mutate `rich.text.Text` instances, which makes them safe to share.
+_SELF_LABEL = Text("self", style="log.label")
+_MSG_LABEL = Text("msg", style="log.label")
+_DATA_LABEL = Text("data", style="log.label")
+_ERR_LABEL = Text("err", style="log.label")
+
+
+@cache
+def _level_text(levelname: str) -> Text:
+    return Text(levelname, style=f"logging.level.{levelname.lower()}")
+
+
 class RichHandler(SplatHandler):
     """A `logging.Handler` extension that uses [rich][] to print pretty nice log
     entries to the console.
@@ -50,13 +63,16 @@ class RichHandler(SplatHandler):
             # default theme (so that any modifications don't spread to any other
             # instances... which usually doesn't matter, since there is
             # typically only one instance, but it's good practice I guess).
-            return Theme(cls.DEFAULT_THEME.styles)
+            #
+            # NOTE  `DEFAULT_THEME.styles` already includes rich's defaults, so
+            #       there's no need to have `Theme` merge them in again.
+            return Theme(cls.DEFAULT_THEME.styles, inherit=False)
 
         if isinstance(theme, Theme):
             # Given a `rich.theme.Theme`, which can be used directly
             return theme
 
-        if satisfies(theme, IO[str]):
+        if satisfies_by_type(theme, IO[str]):
             # Given an open file to read the theme from
             return Theme.from_file(theme)
 
@@ -82,7 +98,7 @@ class RichHandler(SplatHandler):
                 theme=theme,
             )
 
-        if satisfies(console, IO[str]):
+        if satisfies_by_type(console, IO[str]):
             return Console(file=console, theme=theme)
 
         raise TypeError(
@@ -212,10 +228,7 @@ class RichHandler(SplatHandler):
         output.add_column(ratio=1, overflow="fold")
 
         output.add_row(
-            Text(
-                record.levelname,
-                style=f"logging.level.{record.levelname.lower()}",
-            ),
+            _level_text(record.levelname),
             self._get_name_cell(record),
         )
 
@@ -225,20 +238,22 @@ class RichHandler(SplatHandler):
 
         if src := getattr(record, "self", None):
             output.add_row(
-                Text("self", style="log.label"),
+                _SELF_LABEL,
                 ntv_table(src) if isinstance(src, Mapping) else enrich(src),
             )
 
-        output.add_row(
-            Text("msg", style="log.label"), self._get_rich_msg(record)
-        )
+        output.add_row(_MSG_LABEL, self._get_rich_msg(record))
 
         if data := getattr(record, "data", None):
-            output.add_row(Text("data", style="log.label"), ntv_table(data))
+            output.add_row(_DATA_LABEL, ntv_table(data))
 
         if record.exc_info:
+            # Pulls in `pygments`, so only import it once there's actually an
+            # error to render.
+            from rich.traceback import Traceback
+
             output.add_row(
-                Text("err", style="log.label"),
+                _ERR_LABEL,
                 Traceback.from_exception(*record.exc_info),
             )
 
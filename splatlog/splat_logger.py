@@ -21,6 +21,10 @@ from splatlog.typings import Level, LevelValue
 #: was returned.
 _NOT_FOUND = object()
 
+#: Keyword arguments that `logging.Logger._log` takes itself; everything else
+#: passed to a log method is splatted into the record's `data`.
+_LOG_KWDS = frozenset(("exc_info", "extra", "stack_info", "stacklevel"))
+
 
 @cache
 def get_logger(name: str) -> SplatLogger:
@@ -309,9 +313,7 @@ class SplatLogger(logging.LoggerAdapter):
     """
 
     def process(self, msg, kwargs):
-        new_kwargs, data = partition_mapping(
-            kwargs, {"exc_info", "extra", "stack_info", "stacklevel"}
-        )
+        new_kwargs, data = partition_mapping(kwargs, _LOG_KWDS)
         if extra := new_kwargs.get("extra"):
             extra["_splatlog_"] = True
             extra["data"] = data
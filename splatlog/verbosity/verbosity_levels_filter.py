@@ -15,6 +15,9 @@ from splatlog.verbosity.verbosity_state import (
 
 __all__ = ["VerbosityLevelsFilter"]
 
+#: Sentinel for cache misses in `VerbosityLevelsFilter._resolvers_by_name`.
+_NOT_FOUND = object()
+
 TVerbosityLevelsFilter = TypeVar(
     "TVerbosityLevelsFilter", bound="VerbosityLevelsFilter"
 )
@@ -148,6 +151,11 @@ class VerbosityLevelsFilter(logging.Filter):
     #:
     _sorted_verbosity_levels: list[tuple[str, VerbosityLevelResolver]]
 
+    #: Resolver for each logger name seen so far (`None` when no hierarchy
+    #: applies), so the hierarchy walk runs once per name rather than once per
+    #: record. Safe because `_verbosity_levels` never changes after init.
+    _resolvers_by_name: dict[str, Optional[VerbosityLevelResolver]]
+
     def __init__(self, verbosity_levels: VerbosityLevelsCastable):
         super().__init__()
         self._verbosity_levels = cast_verbosity_levels(verbosity_levels)
@@ -155,6 +163,7 @@ class VerbosityLevelsFilter(logging.Filter):
             self._verbosity_levels.items(), key=lambda item: item[0]
         )
         self._sorted_verbosity_levels.reverse()
+        self._resolvers_by_name = {}
 
     @property
     def verbosity_levels(self) -> VerbosityLevels:
@@ -169,11 +178,22 @@ class VerbosityLevelsFilter(logging.Filter):
         if verbosity is None:
             return True
 
-        for hierarchy_name, ranges in self._sorted_verbosity_levels:
-            if is_in_hierarchy(hierarchy_name, record.name):
-                effectiveLevel = ranges.get_level(verbosity)
-                return (
-                    effectiveLevel is None or record.levelno >= effectiveLevel
-                )
+        resolver = self._resolvers_by_name.get(record.name, _NOT_FOUND)
+        if resolver is _NOT_FOUND:
+            resolver = self._resolvers_by_name[
+                record.name
+            ] = self._find_resolver(record.name)
+
+        if resolver is None:
+            return True
+
+        effectiveLevel = resolver.get_level(verbosity)
+        return effectiveLevel is None or record.levelno >= effectiveLevel
 
-        return True
+    def _find_resolver(
+        self, logger_name: str
+    ) -> Optional[VerbosityLevelResolver]:
+        for hierarchy_name, resolver in self._sorted_verbosity_levels:
+            if is_in_hierarchy(hierarchy_name, logger_name):
+                return resolver
+        return None